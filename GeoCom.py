@@ -3,13 +3,46 @@
 
 """
 import sys
+import asyncio
+import itertools
+import logging
 import serial
 import time
 from enum import Enum
 
+log = logging.getLogger(__name__)
+
+
+def _noop(*args):
+    pass
+
+
+def set_debug(enabled):
+    """
+    Rebind the module debug hook.
+
+    The wrappers report through ``_dbg`` instead of ``log.debug`` so that
+    with debugging off every call is a bare no-op instead of a trip through
+    the logging machinery. Call this after changing the log configuration.
+
+    :param enabled: route debug messages through the logger when True
+    :type enabled: bool
+    """
+    global _dbg
+    _dbg = log.debug if enabled else _noop
+
+
+set_debug(log.isEnabledFor(logging.DEBUG))
+
 ser = 0
-Debug_Level = 1
-GTrId = 0
+
+# transaction IDs cycle through 0..7; next() on a count is atomic under
+# the GIL, so concurrent callers never draw the same ID out of turn
+_trid_counter = itertools.count()
+
+# reader/writer pair of the asyncio transport, see COM_OpenConnectionAsync
+a_reader = None
+a_writer = None
 
 
 class AUT_POSMODE(Enum):
@@ -19,7 +52,7 @@ class AUT_POSMODE(Enum):
 
 
 class AUT_ATRMODE(Enum):
-    AUT_POSITION = 0,  # Positioning to the hz - and v - angle
+    AUT_POSITION = 0  # Positioning to the hz - and v - angle
     AUT_TARGET = 1  # Positioning to a target of the hz and v angle
 
 
@@ -31,34 +64,57 @@ class ResponseClass:
     :attribute RC_COM: communication return code
     :attribute TrId: transaction id
     :attribute RC: request return code
-    :attribute parameters: list of returned parameters
+    :attribute parameters: tuple of returned parameters
     """
 
-    RC_COM = 0
-    TrId = 0
-    RC = 0
-    parameters = []
+    __slots__ = ('RC_COM', 'TrId', 'RC', 'parameters')
+
+    def __init__(self):
+        """
+        Init the response with neutral return codes and no parameters.
+        """
+        self.RC_COM = 0
+        self.TrId = 0
+        self.RC = 0
+        self.parameters = ()
 
-    def setResponse(self, response):
+    def setResponse(self, response, parse_params=True):
         """
-        Instantiate a ResponseClass from an ASCII response.
+        Instantiate a ResponseClass from a raw response frame.
 
-        :param response: ASCII response from the station
-        :type response: ResponseClass
+        :param response: raw response frame from the station
+        :type response: bytes
+        :param parse_params: set to False for commands whose caller only
+            consumes the return code, to skip splitting the parameter list
+        :type parse_params: bool
         """
-        if (Debug_Level == 2):
-            print('response = ', response)
-        # remove the ' from the string, remove the end-line character and split it up
-        words = response.replace('\'', '').strip().split(',')
-        # print words
-        if (len(words) > 1):
-            self.RC_COM = int(words[1])
-            words2 = words[2].split(':')
-            self.TrId = int(words2[0])
-            self.RC = int(words2[1])
-            self.parameters = words[3:len(words)]
-            if (self.RC != 0 and Debug_Level == 1):
-                print('Problem occurred, Error code: ', self.RC)
+        _dbg('response = %s', response)
+        # single pass over the frame: locate the delimiters once and convert
+        # the numeric fields on slices, no intermediate copies of the frame;
+        # index/int are bound locally so the loop body stays lookup-free
+        index = response.index
+        _int = int
+        try:
+            i1 = index(b',')
+            i2 = index(b',', i1 + 1)
+            i3 = index(b':', i2 + 1)
+        except ValueError:
+            return
+        self.RC_COM = _int(response[i1 + 1:i2])
+        self.TrId = _int(response[i2 + 1:i3])
+        end = len(response)
+        while end > i3 + 1 and response[end - 1] in b'\r\n':
+            end -= 1
+        i4 = response.find(b',', i3 + 1, end)
+        if (i4 < 0):
+            rc = _int(response[i3 + 1:end])
+        else:
+            rc = _int(response[i3 + 1:i4])
+            if parse_params:
+                self.parameters = tuple(response[i4 + 1:end].split(b','))
+        self.RC = rc
+        if (rc != 0):
+            log.warning('Problem occurred, Error code: %s', rc)
 
 
 class SerialRequestError(Exception):
@@ -85,25 +141,221 @@ class SerialRequestError(Exception):
         return repr(self.value)
 
 
-def getTrId(request):
+def _tune_port(port):
     """
-    Get transaction ID from an ASCII request by parsing it.
+    Apply platform-specific low-latency settings to an open port.
 
-    :param request: an ASCII resquest
-    :type request: str
-    :returns: parsed transaction ID
-    :rtype: int
+    On the win32 backend, enlarging the driver buffers keeps fast
+    repeated measurements from stalling on the small defaults; the other
+    backends do not expose the call and are left alone.
+
+    :param port: open serial.Serial instance
+    """
+    try:
+        port.set_buffer_size(rx_size=4096, tx_size=4096)
+    except (AttributeError, serial.SerialException):
+        pass
+
+
+# persistent frame buffer of the module-level port, reused across requests
+# so the steady-state read path does not allocate a fresh buffer per chunk
+_RESP_BUF = bytearray()
+
+# upper bound on a single response frame; GeoCOM replies are short ASCII
+# lines, so anything bigger than this is line noise, not a frame
+_MAX_FRAME = 1024
+
+
+def _read_frame(port, buf, deadline):
+    """
+    Read one response frame from a port into a reusable buffer.
+
+    :param port: open serial.Serial instance to read from
+    :param buf: bytearray to accumulate the frame into, cleared first
+    :param deadline: time.monotonic() value after which to give up
+    :type deadline: float
+    :returns: the frame buffer, ending with the terminator on success
+    :rtype: bytearray
+    """
+    buf.clear()
+    buf += port.read_until(b'\r\n', _MAX_FRAME)
+    while (not buf.endswith(b'\r\n') and len(buf) < _MAX_FRAME
+           and time.monotonic() < deadline):
+        buf += port.read_until(b'\r\n', _MAX_FRAME - len(buf))
+    return buf
+
+
+def _do_request(port, buf, request, trid, t_timeout, parse_params=True):
+    """
+    Write one request frame on a port and parse the matching response.
+
+    Shared between the module-level SerialRequest and TotalStation, which
+    differ only in which port and frame buffer they own.
+
+    :param port: open serial.Serial instance
+    :param buf: reusable frame buffer of that port
+    :param request: ready-to-write request frame
+    :param trid: transaction ID of the request
+    :param t_timeout: timeout in seconds
+    :param parse_params: set to False for commands whose caller only
+        consumes the return code
+
+    :returns: the corresponding response
+    :rtype: ResponseClass
+
+    :exception SerialRequestError: thrown if an error occurs during the communication
     """
-    words = request.replace('\'', '').strip().split(',')[2].split(':')
-    return int(words[0])
+    _dbg('request = %s', request)
+    response = ResponseClass()
 
+    try:  # try method for the case that TS is not connected
+        port.reset_input_buffer()
+        deadline = time.monotonic() + t_timeout
+        port.write(request)
+        # the kernel blocks on the port and returns when the terminator
+        # arrives; _read_frame keeps reading until the frame is complete
+        # or the deadline passes (searches may take far longer than the
+        # port timeout set at open)
+        serial_output = _read_frame(port, buf, deadline)
+
+        if (not serial_output.endswith(b'\r\n')):
+            response.RC = 3077
+            return response
 
-def SerialRequest(request, length=0, t_timeout=3):
+        response.setResponse(serial_output, parse_params)
+        if response.TrId != trid:
+            response.RC = 3077
+            return response
+    except (serial.SerialException, OSError) as e:
+        raise SerialRequestError("Leica TS communication error - not connected?") from e
+    return response
+
+
+def SerialRequest(request, trid, t_timeout=3, parse_params=True):
     """
     Send a request to the server (total station).
 
     :param request: an ASCII request
-    :param length: to remove later, not needed
+    :param trid: transaction ID of the request, as returned by CreateRequest
+    :param t_timeout: default is 3 seconds, could be higher or lower
+    :param parse_params: set to False for commands whose caller only
+        consumes the return code
+
+    :returns: the corresponding response
+    :rtype: ResponseClass
+
+    :exception SerialRequestError: thrown if an error occurs during the communication
+    """
+    return _do_request(ser, _RESP_BUF, request, trid, t_timeout, parse_params)
+
+
+def SerialRequestPipeline(requests, t_timeout=3):
+    """
+    Send several requests in a single write and read the responses in order.
+
+    Collapses N serial round trips into one: the request frames are
+    concatenated into one buffer, then the matching response frames are
+    read back and parsed one by one.
+
+    :param requests: list of (request, trid) tuples as returned by CreateRequest
+    :param t_timeout: overall timeout for the whole batch, default is 3 seconds
+
+    :returns: the corresponding responses, in request order
+    :rtype: list of ResponseClass
+
+    :exception SerialRequestError: thrown if an error occurs during the communication
+    """
+    responses = []
+
+    try:
+        ser.reset_input_buffer()
+        deadline = time.monotonic() + t_timeout
+        ser.write(b''.join(request for request, trid in requests))
+
+        for request, trid in requests:
+            _dbg('request = %s', request)
+            response = ResponseClass()
+            serial_output = _read_frame(ser, _RESP_BUF, deadline)
+
+            if (not serial_output.endswith(b'\r\n')):
+                response.RC = 3077
+            else:
+                response.setResponse(serial_output)
+                if response.TrId != trid:
+                    response.RC = 3077
+            responses.append(response)
+    except (serial.SerialException, OSError) as e:
+        raise SerialRequestError("Leica TS communication error - not connected?") from e
+    return responses
+
+
+def SerialSubmit(cmd, args=None):
+    """
+    Write a request to the station without waiting for its response.
+
+    Submission/completion split: submit a command, keep the thread busy
+    with CPU work (coordinate math, logging, UI updates) while the
+    station measures, then collect the response with SerialReap. The
+    returned transaction ID is the token to reap with.
+
+    :param cmd: function code to send to the Station
+    :param args: list of arguments
+
+    :returns: transaction ID to hand to SerialReap
+    :rtype: int
+
+    :exception SerialRequestError: thrown if an error occurs during the communication
+    """
+    request, trid = CreateRequest(cmd, args)
+    _dbg('request = %s', request)
+    try:
+        ser.write(request)
+    except (serial.SerialException, OSError) as e:
+        raise SerialRequestError("Leica TS communication error - not connected?") from e
+    return trid
+
+
+def SerialReap(trid, t_timeout=3, parse_params=True):
+    """
+    Read and parse the response of a request submitted with SerialSubmit.
+
+    :param trid: transaction ID returned by SerialSubmit
+    :param t_timeout: default is 3 seconds, could be higher or lower
+    :param parse_params: set to False for commands whose caller only
+        consumes the return code
+
+    :returns: the corresponding response
+    :rtype: ResponseClass
+
+    :exception SerialRequestError: thrown if an error occurs during the communication
+    """
+    response = ResponseClass()
+    try:
+        deadline = time.monotonic() + t_timeout
+        serial_output = _read_frame(ser, _RESP_BUF, deadline)
+
+        if (not serial_output.endswith(b'\r\n')):
+            response.RC = 3077
+            return response
+
+        response.setResponse(serial_output, parse_params)
+        if response.TrId != trid:
+            response.RC = 3077
+            return response
+    except (serial.SerialException, OSError) as e:
+        raise SerialRequestError("Leica TS communication error - not connected?") from e
+    return response
+
+
+async def SerialRequestAsync(request, trid, t_timeout=3):
+    """
+    Coroutine variant of SerialRequest for use with COM_OpenConnectionAsync.
+
+    While this coroutine awaits the station, other coroutines (UI, logging,
+    a second instrument) keep running on the same thread.
+
+    :param request: an ASCII request
+    :param trid: transaction ID of the request, as returned by CreateRequest
     :param t_timeout: default is 3 seconds, could be higher or lower
 
     :returns: the corresponding response
@@ -111,53 +363,71 @@ def SerialRequest(request, length=0, t_timeout=3):
 
     :exception SerialRequestError: thrown if an error occurs during the communication
     """
-    if (Debug_Level == 2):
-        print('request = ', request)
-    id = getTrId(request)
+    _dbg('request = %s', request)
     response = ResponseClass()
-    global ser
 
-    try:  # try method for the case that TS is not connected
-        ser.read(ser.inWaiting())
-        ser.write(request + '\r\n')
-        t_start = time.time()
-        # do as long as:
-        # 1: buffer has specific length
-        # 2: if specific length not defined (=0), then until buffer > 0
-        # 3: timeout not reached
-        while ((ser.inWaiting() < length or (
-                length == 0 and ser.inWaiting() == 0)) and time.time() - t_start < t_timeout):
-            time.sleep(0.001)
-
-        if (time.time() - t_start >= t_timeout):
+    try:
+        a_writer.write(request)
+        await a_writer.drain()
+        try:
+            serial_output = await asyncio.wait_for(
+                a_reader.readuntil(b'\r\n'), timeout=t_timeout)
+        except asyncio.TimeoutError:
             response.RC = 3077
             return response
 
-        time.sleep(0.025)  # Short break to make sure serial port is not read while stuff is written
-        serial_output = ser.read(ser.inWaiting())
         response.setResponse(serial_output)
-        if response.TrId != id:
+        if response.TrId != trid:
             response.RC = 3077
             return response
-    except KeyboardInterrupt as e:
-        raise KeyboardInterrupt(e)
-    except:
-        raise SerialRequestError("Leica TS communication error - not connected?")
-        response.RC = 1
+    except (serial.SerialException, OSError) as e:
+        raise SerialRequestError("Leica TS communication error - not connected?") from e
     return response
 
 
-def HexToDec(hex_in):
+def _fmt(value):
     """
-    Convert an hexadecimal number into a decimal number.
+    Format a single request argument as ASCII bytes.
 
-    :param hex_in: hexadecimal number to convert
-    :type hex_in: int
-    :returns: decimal representation of hex_in
-    :rtype: int
+    Enum members are sent as their numeric value, so wrappers can pass
+    AUT_POSMODE/AUT_ATRMODE members or plain ints interchangeably.
+
+    :param value: argument to format
+    :returns: ASCII representation of the argument
+    :rtype: bytes
+    """
+    if type(value) is int:
+        return b'%d' % value
+    if type(value) is float:
+        # 17 significant digits round-trip any double exactly
+        return b'%.17g' % value
+    if isinstance(value, Enum):
+        return _fmt(value.value)
+    return str(value).encode()
+
+
+# static per-command frame heads, built once per command code on first use
+_REQUEST_HEADS = {}
+
+# fully prebuilt frames for zero-parameter commands, keyed by command code;
+# element i of each tuple is the frame carrying transaction ID i
+_ZERO_ARG_FRAMES = {}
+
+
+def _request_head(cmd):
+    """
+    Return the constant part of the request frame for a command code
+    (everything before the transaction ID).
+
+    :param cmd: function code to send to the Station
+    :returns: cached frame head
+    :rtype: bytes
     """
-    dec_out = int(hex_in, 16)
-    return dec_out
+    head = _REQUEST_HEADS.get(cmd)
+    if head is None:
+        # \n is LF flag to flush buffer
+        head = _REQUEST_HEADS[cmd] = b'\n%%R1Q,%s,' % str(cmd).encode()
+    return head
 
 
 def CreateRequest(cmd, args=None):
@@ -167,27 +437,91 @@ def CreateRequest(cmd, args=None):
     :param cmd: function code to send to the Station
     :param args: list of arguments
 
-    :returns: an ASCII request with this form
+    :returns: a ready-to-write ASCII request with this form
         [<LF>]%R1Q,cmd,<TrId>:[args]<Term>
-    :rtype: str
+        and the transaction ID used, to be handed to SerialRequest
+    :rtype: (bytes, int)
     """
-    global GTrId
-    # \n is LF flag to flush buffer
-    request = '\n%R1Q,'
-    request = request + str(cmd) + ',' + str(GTrId)
-    request = request + ':'
+    trid = next(_trid_counter) & 7
+
+    if not args:
+        # zero-parameter commands recur with identical frames; keep the
+        # eight possible frames (one per transaction ID) prebuilt
+        frames = _ZERO_ARG_FRAMES.get(cmd)
+        if frames is None:
+            head = _request_head(cmd)
+            frames = _ZERO_ARG_FRAMES[cmd] = tuple(
+                head + b'%d:\r\n' % i for i in range(8))
+        return frames[trid], trid
 
-    GTrId += 1
-    if GTrId == 8:
-        GTrId = 0
+    head = _request_head(cmd) + b'%d:' % trid
+    body = b','.join(_fmt(a) for a in args)
+    return head + body + b'\r\n', trid
 
-    if (args != None):
-        if (len(args) > 0):
-            for i in range(0, len(args)):
-                request = request + str(args[i])
-                request = request + ','
-            request = request + str(args[-1])
-        return request
+
+class TotalStation:
+    """
+    Drive one instrument over its own serial port.
+
+    The module-level functions share a single global port, which fits the
+    one-station tracking scripts but rules out driving several instruments
+    from one process. A TotalStation instance owns its port, its
+    transaction IDs and its frame buffer, so independent instances never
+    share state.
+
+    :attribute ser: the serial.Serial instance of this station
+    """
+
+    def __init__(self, ePort, eRate, t_timeout=3):
+        """
+        Open the serial port of this station.
+
+        :param ePort: serial port
+        :type ePort: str
+        :param eRate: baud rate
+        :type eRate: int
+        :param t_timeout: port timeout in seconds
+        :type t_timeout: int
+        """
+        self.ser = serial.Serial(
+            port=ePort,
+            baudrate=eRate,
+            parity=serial.PARITY_NONE,
+            stopbits=serial.STOPBITS_ONE,
+            bytesize=serial.EIGHTBITS,
+            timeout=t_timeout,
+            write_timeout=t_timeout
+        )
+        _tune_port(self.ser)
+        self._trid_counter = itertools.count()
+        self._resp_buf = bytearray()
+
+    def close(self):
+        """
+        Close the serial port of this station.
+        """
+        self.ser.close()
+
+    def request(self, cmd, args=None, t_timeout=3, parse_params=True):
+        """
+        Send one GeoCOM command to this station and return the parsed response.
+
+        :param cmd: function code to send to the Station
+        :param args: list of arguments
+        :param t_timeout: default is 3 seconds, could be higher or lower
+        :param parse_params: set to False for commands whose caller only
+            consumes the return code
+
+        :returns: the corresponding response
+        :rtype: ResponseClass
+
+        :exception SerialRequestError: thrown if an error occurs during the communication
+        """
+        trid = next(self._trid_counter) & 7
+        head = _request_head(cmd) + b'%d:' % trid
+        body = b','.join(_fmt(a) for a in args) if args else b''
+        return _do_request(self.ser, self._resp_buf,
+                           head + body + b'\r\n', trid, t_timeout, parse_params)
 
 
 """#############################################################################
@@ -225,25 +559,61 @@ def COM_OpenConnection(ePort, eRate, nRetries=10):
     """
 
     global ser
+    # serial.Serial opens the port in its constructor, so retrying means
+    # re-running the constructor, not poking at an already-open object
+    for i in range(nRetries):
+        try:
+            ser = serial.Serial(
+                port=ePort,
+                baudrate=eRate,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE,
+                bytesize=serial.EIGHTBITS,
+                timeout=3,
+                write_timeout=3
+            )
+            _tune_port(ser)
+
+            # 0 = everything ok
+            return [0, ser, 0]
+
+        except serial.SerialException as e:
+            log.warning('Connection attempt %d of %d failed: %s', i + 1, nRetries, e)
+            time.sleep(0.1)
+
+    print("Connection Error - Leica TS not connected?\n")
+    return [1, 0, []]
+
+
+async def COM_OpenConnectionAsync(ePort, eRate):
+    """
+    Coroutine variant of COM_OpenConnection, requires the pyserial-asyncio
+    package. Opens the port through the running event loop so that
+    SerialRequestAsync can await responses without blocking the thread.
+
+    :param ePort: serial port
+    :type ePort: str
+    :param eRate: baud rate
+    :type eRate: int
+
+    :returns: [error, RC, []]
+
+    * error=0 and RC=0 if the connection attempt was successful
+    * error=1 if not
+
+    :rtype: list
+    """
+    global a_reader, a_writer
     try:
-        ser = serial.Serial(
-            port=ePort,
+        import serial_asyncio
+        a_reader, a_writer = await serial_asyncio.open_serial_connection(
+            url=ePort,
             baudrate=eRate,
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE,
             bytesize=serial.EIGHTBITS
         )
-
-        while (not ser.isOpen()):
-            ser.open()
-            if (not ser.isOpen()):
-                ser.close()
-
-        if (not ser.isOpen() and Debug_Level == 1):
-            print('Problem opening port')
-
-        # 0 = everything ok
-        return [not ser.isOpen(), ser, 0]
+        return [0, 0, []]
 
     except Exception as e:
         print("Connection Error - Leica TS not connected?\n")
@@ -251,6 +621,21 @@ def COM_OpenConnection(ePort, eRate, nRetries=10):
         return [1, 0, []]
 
 
+async def COM_CloseConnectionAsync():
+    """
+    Close the port opened by COM_OpenConnectionAsync.
+
+    :returns: [error, RC, []]. error=0 and RC=0 if the request is successful.
+    :rtype: list
+    """
+    global a_reader, a_writer
+    a_writer.close()
+    await a_writer.wait_closed()
+    a_reader = None
+    a_writer = None
+    return [0, 0, []]
+
+
 def COM_CloseConnection():
     """
     [GeoCOM manual **p27**]
@@ -264,8 +649,8 @@ def COM_CloseConnection():
     global ser
     ser.close()
 
-    if (not ser.isOpen() and Debug_Level == 1):
-        print('Problem closing port')
+    if (not ser.isOpen()):
+        log.warning('Problem closing port')
 
     return [ser.isOpen(), 0, []]
 
@@ -273,24 +658,21 @@ def COM_CloseConnection():
 def COM_SwitchOnTPS(eOnMode=2):
     """ [GeoCOM manual **p96**] """
 
-    request = CreateRequest('111', [eOnMode])
+    request, trid = CreateRequest('111', [eOnMode])
 
-    response = SerialRequest(request, 0, 60)
+    response = SerialRequest(request, trid, 60, parse_params=False)
 
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Turn on TPS')
+        _dbg('Turn on TPS')
 
     elif (response.RC == 5):
         error = 0
-        if (Debug_Level == 1):
-            print('TPS already turned on')
+        _dbg('TPS already turned on')
 
     else:
         error = 1
-        if (Debug_Level == 1):
-            print('Problem turning TPS on')
+        _dbg('Problem turning TPS on')
 
     return [error, response.RC, []]
 
@@ -298,19 +680,17 @@ def COM_SwitchOnTPS(eOnMode=2):
 def COM_SwitchOffTPS(eOffMode=0):
     """ [GeoCOM manual **p97**] """
 
-    request = CreateRequest('112', [eOffMode])
+    request, trid = CreateRequest('112', [eOffMode])
 
-    response = SerialRequest(request, 0, 60)
+    response = SerialRequest(request, trid, 60, parse_params=False)
 
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Shut down TPS')
+        _dbg('Shut down TPS')
 
     else:
         error = 1
-        if (Debug_Level == 1):
-            print('Error shutting down TPS')
+        _dbg('Error shutting down TPS')
 
     return [error, response.RC, []]
 
@@ -318,9 +698,9 @@ def COM_SwitchOffTPS(eOffMode=0):
 def COM_GetSWVersion():
     """ [GeoCOM manual **p95**] """
 
-    request = CreateRequest('110', [])
+    request, trid = CreateRequest('110', [])
 
-    response = SerialRequest(request, 0, 60)
+    response = SerialRequest(request, trid, 60)
 
     if (response.RC == 0):
         error = 0
@@ -334,6 +714,39 @@ def COM_GetSWVersion():
     return [error, response.RC, []]
 
 
+def COM_SetBinaryAvailable(bAvailable=0):
+    """
+    [GeoCOM manual **p94**]
+
+    Set the ability of the server to handle binary communication. With
+    bAvailable=0 the server always replies in ASCII.
+
+    Note that this driver only builds and parses the ASCII framing, so
+    binary mode is only useful for callers that bring their own binary
+    encoder/decoder.
+
+    :param bAvailable: binary operation enabled (=1) or disabled (=0)
+    :type bAvailable: int
+
+    :returns: [error, RC, []]
+
+    * error=0 and RC=0 if the request is successful
+    * error=1 if not
+
+    :rtype: list
+    """
+
+    request, trid = CreateRequest('113', [bAvailable])
+
+    response = SerialRequest(request, trid, parse_params=False)
+
+    error = 1
+    if (response.RC == 0):
+        error = 0
+
+    return [error, response.RC, []]
+
+
 """#############################################################################
 ########################## CSV - CENTRAL SERVICES ##############################
 ################################################################################
@@ -348,22 +761,17 @@ def CSV_GetDateTime():
     """
     DateTime = []
 
-    request = CreateRequest('110', [])
+    request, trid = CreateRequest('110', [])
 
-    response = SerialRequest(request, 0, 60)
-
-    response = SerialRequest()
+    response = SerialRequest(request, trid, 60)
 
     error = 1
     if (response.RC == 0):
         error = 0
 
-        DateTime = [int(response.parameters[0])]
-        for i in range(1, len(response.parameters)):
-            DateTime.append(HexToDec(response.parameters[i]))
+        DateTime = [int(response.parameters[0])] + [int(p, 16) for p in response.parameters[1:]]
 
-        if (Debug_Level == 1):
-            print('Date and Time: ', DateTime)
+        _dbg('Date and Time: %s', DateTime)
 
     return [error, response.RC, DateTime]
 
@@ -374,16 +782,13 @@ def CSV_GetInstrumentNo():
     FlexLine Geocom 1.20 page 55
     :return: Serial Number
     """
-    DateTime = []
-
-    request = CreateRequest('5003:', [])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('5003', [])
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Serial number : ' + str(response.parameters))
+        _dbg('Serial number : %s', response.parameters)
 
     return [error, response.RC, response.parameters]
 
@@ -395,14 +800,13 @@ def CSV_GetInstrumentName():
     :return: Serial Number
     """
 
-    request = CreateRequest('5004', [])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('5004', [])
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Instrument name : ' + str(response.parameters))
+        _dbg('Instrument name : %s', response.parameters)
 
     return [error, response.RC, response.parameters]
 
@@ -415,14 +819,13 @@ def CSV_GetReflectorlessClass():
     :return: Prism type
     """
     # TODO maybe this is not correct
-    request = CreateRequest("5100", [])
-    response = SerialRequest(request)
+    request, trid = CreateRequest("5100", [])
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Prism : ' + str(response.parameters))
+        _dbg('Prism : %s', response.parameters)
 
     return [error, response.RC, response.parameters]
 
@@ -452,15 +855,14 @@ def AUT_MakePositioning(Hz, V, POSMode=0, ATRMode=0, bDummy=0):
     [GeoCOM manual **p49**]
     """
 
-    request = CreateRequest('9027', [Hz, V, POSMode, ATRMode, bDummy])
+    request, trid = CreateRequest('9027', [Hz, V, POSMode, ATRMode, bDummy])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Going to new position: ', Hz, ',', V)
+        _dbg('Going to new position: %s,%s', Hz, V)
 
     return [error, response.RC, []]
 
@@ -486,19 +888,17 @@ def AUT_Search(Hz_Area, V_Area, bDummy=0):
     :rtype: list
     """
 
-    request = CreateRequest('9029', [Hz_Area, V_Area, bDummy])
+    request, trid = CreateRequest('9029', [Hz_Area, V_Area, bDummy])
 
-    response = SerialRequest(request, 0, 120)
+    response = SerialRequest(request, trid, 120, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Target search successful')
+        _dbg('Target search successful')
     else:
-        if (Debug_Level == 1):
-            if (response.RC == 8710):
-                print('No target found')
+        if (response.RC == 8710):
+            _dbg('No target found')
 
     return [error, response.RC, []]
 
@@ -524,9 +924,9 @@ def AUT_FineAdjust(dSrchHz=0.1, dSrchV=0.1):
     :rtype: list
     """
 
-    request = CreateRequest('9037', [dSrchHz, dSrchV, 0])
+    request, trid = CreateRequest('9037', [dSrchHz, dSrchV, 0])
 
-    response = SerialRequest(request, 0, 120)
+    response = SerialRequest(request, trid, 120, parse_params=False)
 
     error = 1
     if (response.RC == 0):
@@ -551,15 +951,14 @@ def AUT_LockIn():
     :rtype: list
     """
 
-    request = CreateRequest('9013', [])
+    request, trid = CreateRequest('9013', [])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Lock successful')
+        _dbg('Lock successful')
 
     return [error, response.RC, []]
 
@@ -578,14 +977,13 @@ def AUT_GetSearchArea():
 
     :rtype: list
     """
-    request = CreateRequest('9042', [])
+    request, trid = CreateRequest('9042', [])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Parameters: ', response.parameters)
+        _dbg('Parameters: %s', response.parameters)
 
     return [error, response.RC, response.parameters]
 
@@ -615,8 +1013,8 @@ def AUT_SetSearchArea(dCenterHz, dCenterV, dRangeHz, dRangeV, bEnabled=1):
 
     :rtype: list
     """
-    request = CreateRequest('9043', [dCenterHz, dCenterV, dRangeHz, dRangeV, bEnabled])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('9043', [dCenterHz, dCenterV, dRangeHz, dRangeV, bEnabled])
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
@@ -640,8 +1038,8 @@ def AUT_PS_EnableRange(bEnable):
     :rtype: list
     """
 
-    request = CreateRequest('9048', [bEnable])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('9048', [bEnable])
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
@@ -668,8 +1066,8 @@ def AUT_PS_SetRange(lMinDist, lMaxDist):
 
     :rtype: list
     """
-    request = CreateRequest('9047', [lMinDist, lMaxDist])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('9047', [lMinDist, lMaxDist])
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
@@ -696,8 +1094,8 @@ def AUT_PS_SearchWindow():
 
     :rtype: list
     """
-    request = CreateRequest('9052', [])
-    response = SerialRequest(request, 0, 120)
+    request, trid = CreateRequest('9052', [])
+    response = SerialRequest(request, trid, 120, parse_params=False)
     print(str(response.RC))
     error = 1
     if (response.RC == 0):
@@ -712,8 +1110,8 @@ def AUT_ReadToi():
     nstrument axis. This command is valid for motorized instruments only.
     :return: [error, RC, [Tolerance Hz[double],Tolerance V[double]]
     """
-    request = CreateRequest('9008', [])
-    response = SerialRequest(request, 0, 120)
+    request, trid = CreateRequest('9008', [])
+    response = SerialRequest(request, trid, 120, parse_params=False)
     print(str(response.RC))
     error = 1
     if (response.RC == 0):
@@ -730,8 +1128,8 @@ def AUT_SetTol(toleranceHz=1.0, toleranceV=1.0):
     :return: error, RC, []
     """
 
-    request = CreateRequest('9007', [toleranceHz, toleranceV])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('9007', [toleranceHz, toleranceV])
+    response = SerialRequest(request, trid, parse_params=False)
     print(str(response.RC))
     error = 1
     if (response.RC == 0):
@@ -745,8 +1143,8 @@ def AUT_ReadTimeout():
     This command reads the current setting for the positioning time out (maximum time to perform positioning).
     :return: error, RC, RC, [TimeoutHz[double], TimeoutV[double]]
     """
-    request = CreateRequest('9012', [])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('9012', [])
+    response = SerialRequest(request, trid)
     print(str(response.RC))
     error = 1
     if (response.RC == 0):
@@ -769,16 +1167,12 @@ def AUT_ChangeFace(PosMode, ATRMode):
     If ATR mode is activated and the ATR mode is set to AUT_TARGET, the instrument tries to position onto a target in the destination
     area. If LOCK mode is activated and the ATR mode is set to AUT_TARGET, the instrument tries to lock onto a target in the destination
     area.
+    PosMode and ATRMode may be given as AUT_POSMODE/AUT_ATRMODE members or
+    as their plain int values.
     :return: error, RC []
     """
-    if not isinstance(PosMode, AUT_POSMODE):
-        raise TypeError('PosMode must be an instance of AUT_POSMODE Enum')
-
-    if not isinstance(ATRMode, AUT_ATRMODE):
-        raise TypeError('ATRMode must be an instance of AUT_ATRMODE Enum')
-
-    request = CreateRequest('9028', [PosMode, ATRMode, 0])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('9028', [PosMode, ATRMode, 0])
+    response = SerialRequest(request, trid, parse_params=False)
     error = 1
     if (response.RC == 0):
         error = 0
@@ -794,8 +1188,8 @@ def AUT_GetFineAdjustMode():
 
     :return:
     """
-    request = CreateRequest('9030', [])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('9030', [])
+    response = SerialRequest(request, trid)
     error = 1
     if (response.RC == 0):
         error = 0
@@ -827,15 +1221,14 @@ def EDM_Laserpointer(eOn=0):
     :rtype: list
     """
 
-    request = CreateRequest('1004', [eOn])
+    request, trid = CreateRequest('1004', [eOn])
 
-    response = SerialRequest(request, 0, 30)
+    response = SerialRequest(request, trid, 30, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Laserpointer turned on/off')
+        _dbg('Laserpointer turned on/off')
 
     return [error, response.RC, []]
 
@@ -853,14 +1246,13 @@ def TMC_GetStation():
     This function is used to get the co-ordinates of the instrument station
     :return: %R1P,0,0:RC,E0[double],N0[double],H0[double],Hi[double]
     """
-    request = CreateRequest("2009", [])
-    response = SerialRequest(request)
+    request, trid = CreateRequest("2009", [])
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Coordinates : ' + str(response.parameters))
+        _dbg('Coordinates : %s', response.parameters)
 
     # %R1P,0,0:RC,E0[double],N0[double],H0[double],Hi[double]
     return [error, response.RC, response.parameters]
@@ -871,14 +1263,13 @@ def TMC_SetStation(e0=0.0, N0=0.0, H0=0.0, Hi=0.0):
     This function is used to get the co-ordinates of the instrument station
     :return: %R1P,0,0:RC,E0[double],N0[double],H0[double],Hi[double]
     """
-    request = CreateRequest('2010', [e0, N0, H0, Hi])
-    response = SerialRequest(request)
+    request, trid = CreateRequest('2010', [e0, N0, H0, Hi])
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Coorinates set : ' + str(response.RC))
+        _dbg('Coorinates set : %s', response.RC)
 
     # %R1P,0,0:RC,E0[double],N0[double],H0[double],Hi[double]
     return [error, response.RC, []]
@@ -889,14 +1280,13 @@ def TMC_GetRefractiveMethod():
     This function is used to get the current refraction model.
     :return:
     """
-    request = CreateRequest("2091", [])
-    response = SerialRequest(request)
+    request, trid = CreateRequest("2091", [])
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Prism : ' + str(response.parameters))
+        _dbg('Prism : %s', response.parameters)
 
     return [error, response.RC, response.parameters]
 
@@ -924,9 +1314,9 @@ def TMC_SetOrientation():
     :rtype: list
     """
 
-    request = CreateRequest('2113', [0])
+    request, trid = CreateRequest('2113', [0])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
@@ -955,15 +1345,14 @@ def TMC_DoMeasure(cmd=1, mode=1):  # TMC Measurement Modes in geocom manual p.91
     :rtype: list
     """
 
-    request = CreateRequest('2008', [cmd, mode])
+    request, trid = CreateRequest('2008', [cmd, mode])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Measuring successful')
+        _dbg('Measuring successful')
 
     return [error, response.RC, []]
 
@@ -1005,15 +1394,14 @@ def TMC_SetEdmMode(mode=6):
     :rtype: list
     """
 
-    request = CreateRequest('2020', [mode])
+    request, trid = CreateRequest('2020', [mode])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('EDM Mode set successfully')
+        _dbg('EDM Mode set successfully')
 
     return [error, response.RC, []]
 
@@ -1023,9 +1411,9 @@ def TMC_GetCoordinate(WaitTime=100, mode=1):
 
     coord = []
 
-    request = CreateRequest('2082', [WaitTime, mode])
+    request, trid = CreateRequest('2082', [WaitTime, mode])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
 
     error = 0
 
@@ -1033,8 +1421,7 @@ def TMC_GetCoordinate(WaitTime=100, mode=1):
 
         coord = [float(response.parameters[0]), float(response.parameters[1]), float(response.parameters[2])]
 
-        if (Debug_Level == 1):
-            print('Coordinates read successfully: ', coord)
+        _dbg('Coordinates read successfully: %s', coord)
 
     return [error, response.RC, coord]
 
@@ -1044,9 +1431,9 @@ def TMC_GetStation(WaitTime=100):
 
     coord = []
 
-    request = CreateRequest('2009', [WaitTime])
+    request, trid = CreateRequest('2009', [WaitTime])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
 
     error = 0
 
@@ -1055,14 +1442,15 @@ def TMC_GetStation(WaitTime=100):
         coord = [float(response.parameters[0]), float(response.parameters[1]), float(response.parameters[2]),
                  float(response.parameters[3])]
 
-        if (Debug_Level == 1):
-            print('Station coordinates received successfully! ', coord)
+        _dbg('Station coordinates received successfully! %s', coord)
 
     return [error, response.RC, []]
 
 
 def TMC_GetSimpleMea(WaitTime=100,
-                     mode=1):  # TMC_GetSimpleMea - Returns angle and distance measurement - geocom manual p.95
+                     mode=1,
+                     _req=CreateRequest,
+                     _send=SerialRequest):  # TMC_GetSimpleMea - Returns angle and distance measurement - geocom manual p.95
     """
     [GeoCOM manual **p132**]
 
@@ -1088,28 +1476,65 @@ def TMC_GetSimpleMea(WaitTime=100,
     """
 
     coord = []
-    request = CreateRequest('2108', [WaitTime, mode])
+    request, trid = _req('2108', [WaitTime, mode])
 
-    response = SerialRequest(request)
+    response = _send(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
         if len(response.parameters) < 3:
             return [1, 1, []]
-        coord = [response.parameters[0], response.parameters[1], response.parameters[2]]
-        if (Debug_Level == 1):
-            print('Coordinates read successfully: ', coord)
+        coord = [float(response.parameters[0]), float(response.parameters[1]), float(response.parameters[2])]
+        _dbg('Coordinates read successfully: %s', coord)
     if (response.RC == 1284):
         error = 1284
-        coord = [response.parameters[0], response.parameters[1], response.parameters[2]]
-        if (Debug_Level == 1):
-            print('Accuracy could not be verified: ', coord)
+        coord = [float(response.parameters[0]), float(response.parameters[1]), float(response.parameters[2])]
+        _dbg('Accuracy could not be verified: %s', coord)
     if (response.RC == 1285):
         error = 1285
-        coord = [response.parameters[0], response.parameters[1]]
-        if (Debug_Level == 1):
-            print('Angles read successfully: ', coord)
+        coord = [float(response.parameters[0]), float(response.parameters[1])]
+        _dbg('Angles read successfully: %s', coord)
+
+    return [error, response.RC, coord]
+
+
+def TMC_DoMeasureAndGetSimpleMea(WaitTime=100, mode=1, cmd=1):
+    """
+    Issue TMC_DoMeasure and TMC_GetSimpleMea as one pipelined batch.
+
+    Both frames go out in a single write and the two responses are read
+    back in order, saving one full serial round trip per measurement
+    cycle compared to calling the two functions separately.
+
+    :param WaitTime: Delay to wait for the distance measurement to finish [ms]
+    :type WaitTime: int
+    :param mode: Inclination sensor measurement mode
+    :type mode: int
+    :param cmd: TMC measurement mode (see **p127** of GeoCOM ref manual)
+    :type cmd: int
+
+    :returns: [error, RC, coord], same contract as TMC_GetSimpleMea
+    :rtype: list
+    """
+
+    coord = []
+    responses = SerialRequestPipeline([CreateRequest('2008', [cmd, mode]),
+                                       CreateRequest('2108', [WaitTime, mode])])
+    response = responses[1]
+
+    error = 1
+    if (response.RC == 0):
+        error = 0
+        if len(response.parameters) < 3:
+            return [1, 1, []]
+        coord = [float(response.parameters[0]), float(response.parameters[1]), float(response.parameters[2])]
+    if (response.RC == 1284):
+        error = 1284
+        coord = [float(response.parameters[0]), float(response.parameters[1]), float(response.parameters[2])]
+    if (response.RC == 1285):
+        error = 1285
+        coord = [float(response.parameters[0]), float(response.parameters[1])]
 
     return [error, response.RC, coord]
 
@@ -1118,8 +1543,8 @@ def TMC_QuickDist():
     """ [GeoCOM manual **p138**] """
 
     coord = []
-    request = CreateRequest('2117')
-    response = SerialRequest(request)
+    request, trid = CreateRequest('2117')
+    response = SerialRequest(request, trid)
     error = 1
     if (response.RC == 0):
         error = 0
@@ -1131,9 +1556,9 @@ def TMC_QuickDist():
 def TMC_GetAngle(mode=1):
     """ Refer to *TMC_GetAngle5* in GeoCOM manual **p136** """
     coord = []
-    request = CreateRequest('2107', [mode])
+    request, trid = CreateRequest('2107', [mode])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
     error = 1
 
     if (len(response.parameters) == 2):
@@ -1176,15 +1601,14 @@ def TMC_GetEdmMode():
     ##        EDM_AVERAGE_LR          12,// LO Average
     ##        EDM_PRECISE_IR          13,// IR Precise (TS30, TM30)
     ##        EDM_PRECISE_TAPE        14,// IR Precise Reflector Tape (TS30, TM30)
-    request = CreateRequest('2021', [])
+    request, trid = CreateRequest('2021', [])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('EDM Mode read successfully: ')
+        _dbg('EDM Mode read successfully: ')
 
     return [error, response.RC, response.parameters]
 
@@ -1211,7 +1635,7 @@ def TMC_GetEdmMode():
 #
 #    request = CreateRequest('2020',[mode])
 #
-#    response = SerialRequest(request)
+#    response = SerialRequest(request, trid)
 #
 #    error = 1
 #    if(response.RC==0) :
@@ -1247,15 +1671,14 @@ MOT_TERM = 7 // terminates the controller task
 
 def MOT_StartController(ControlMode=1):
     """ [GeoCOM manual **p119**] """
-    request = CreateRequest('6001', [ControlMode])
+    request, trid = CreateRequest('6001', [ControlMode])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Motor controller started')
+        _dbg('Motor controller started')
 
     return [error, response.RC, []]
 
@@ -1271,15 +1694,14 @@ MOT_SHUTDOWN = 1 // slow down by switch off power supply
 def MOT_StopController(Mode=0):
     """ [GeoCOM manual **p120**] """
 
-    request = CreateRequest('6000', [Mode])
+    request, trid = CreateRequest('6000', [Mode])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Motor controller stopped')
+        _dbg('Motor controller stopped')
 
     return [error, response.RC, []]
 
@@ -1292,15 +1714,14 @@ def MOT_StopController(Mode=0):
 def MOT_SetVelocity(Hz_speed, v_speed):
     """ [GeoCOM manual **p121**] """
 
-    request = CreateRequest('6004', [Hz_speed, v_speed])
+    request, trid = CreateRequest('6004', [Hz_speed, v_speed])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Velocity set')
+        _dbg('Velocity set')
 
     return [error, response.RC, []]
 
@@ -1319,17 +1740,16 @@ BAP_TARGET_TYPE = {0: 'BAP_REFL_USE',  # with reflector
 def BAP_GetTargetType():
     """ [GeoCOM manual **p71**] """
     parameter = []
-    request = CreateRequest('17022', [])
+    request, trid = CreateRequest('17022', [])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
         parameter = response.parameters[0]
 
-        if (Debug_Level == 1):
-            print('Target type: ', BAP_TARGET_TYPE[int(response.parameters[0])][1])
+        _dbg('Target type: %s', BAP_TARGET_TYPE[int(response.parameters[0])][1])
 
     return [error, response.RC, parameter]
 
@@ -1337,15 +1757,14 @@ def BAP_GetTargetType():
 def BAP_SetTargetType(eTargetType=0):
     """ [GeoCOM manual **p72**] """
 
-    request = CreateRequest('17021', [eTargetType])
+    request, trid = CreateRequest('17021', [eTargetType])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Target type set successfully ')
+        _dbg('Target type set successfully ')
 
     return [error, response.RC, []]
 
@@ -1373,16 +1792,15 @@ def BAP_GetPrismType():
     """ [GeoCOM manual **p73**] """
     parameter = []
 
-    request = CreateRequest('17009', [])
+    request, trid = CreateRequest('17009', [])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
         parameter = [response.parameters[0], BAP_PRISMTYPE[int(response.parameters[0])][1]]
-        if (Debug_Level == 1):
-            print('Prism type: ', BAP_PRISMTYPE[int(response.parameters[0])][1])
+        _dbg('Prism type: %s', BAP_PRISMTYPE[int(response.parameters[0])][1])
 
     return [error, response.RC, parameter]
 
@@ -1409,15 +1827,14 @@ def BAP_SetPrismType(ePrismType):
     :rtype: list
     """
 
-    request = CreateRequest('17008', [ePrismType])
+    request, trid = CreateRequest('17008', [ePrismType])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Prism type set')
+        _dbg('Prism type set')
 
     return [error, response.RC, []]
 
@@ -1425,15 +1842,14 @@ def BAP_SetPrismType(ePrismType):
 def BAP_SetMeasPrg(eMeasPrg):
     """ [GeoCOM manual **p81**] """
 
-    request = CreateRequest('17019', [eMeasPrg])
+    request, trid = CreateRequest('17019', [eMeasPrg])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Measurement program set')
+        _dbg('Measurement program set')
 
     return [error, response.RC, []]
 
@@ -1452,13 +1868,13 @@ BAP_USER_MEASPRG = {0: ['BAP_SINGLE_REF_STANDARD', 'Reflector, Standard'],
                     11: ['BAP_SINGLE_REF_PRECISE', 'not available']}
 
 
-def BAP_MeasDistanceAngle(mode=6):
+def BAP_MeasDistanceAngle(mode=6, _req=CreateRequest, _send=SerialRequest):
     """ [GeoCOM manual **p82**] """
     coord = []
 
-    request = CreateRequest('17017', [mode])
+    request, trid = _req('17017', [mode])
 
-    response = SerialRequest(request)
+    response = _send(request, trid)
 
     error = None
 
@@ -1467,8 +1883,7 @@ def BAP_MeasDistanceAngle(mode=6):
         coord = [float(response.parameters[0]), float(response.parameters[1]), float(response.parameters[2]),
                  int(response.parameters[3])]
 
-        if (Debug_Level == 1):
-            print('Got data successfully: ', coord)
+        _dbg('Got data successfully: %s', coord)
 
     return [error, response.RC, coord]
 
@@ -1478,16 +1893,15 @@ def BAP_GetMeasPrg():
 
     parameter = []
 
-    request = CreateRequest('17018', [])
+    request, trid = CreateRequest('17018', [])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
         parameter = [response.parameters[0], BAP_USER_MEASPRG[int(response.parameters[0])][1]]
-        if (Debug_Level == 1):
-            print('Measurement program: ', BAP_USER_MEASPRG[int(response.parameters[0])][1])
+        _dbg('Measurement program: %s', BAP_USER_MEASPRG[int(response.parameters[0])][1])
 
     return [error, response.RC, parameter]
 
@@ -1495,24 +1909,20 @@ def BAP_GetMeasPrg():
 def BAP_SearchTarget(bDummy=0):
     """ [GeoCOM manual **p84**] """
 
-    request = CreateRequest('17020', [bDummy])
+    request, trid = CreateRequest('17020', [bDummy])
 
-    response = SerialRequest(request, 0, 10)
+    response = SerialRequest(request, trid, 10, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Prism found!')
+        _dbg('Prism found!')
 
     else:
-        if (Debug_Level == 1):
-
-            if (response.RC == 8710):
-                print('No prism found!')
-
-            elif (response.RC == 8711):
-                print('Multiple prism found!')
+        if (response.RC == 8710):
+            _dbg('No prism found!')
+        elif (response.RC == 8711):
+            _dbg('Multiple prism found!')
 
     return [error, response.RC, []]
 
@@ -1528,15 +1938,14 @@ button.
 def AUS_SetUserLockState(on=0):
     """ [GeoCOM manual **p42**] """
 
-    request = CreateRequest('18007', [on])
+    request, trid = CreateRequest('18007', [on])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Lock activated or deactivated')
+        _dbg('Lock activated or deactivated')
 
     return [error, response.RC, []]
 
@@ -1544,15 +1953,14 @@ def AUS_SetUserLockState(on=0):
 def AUS_SetUserAtrState(on=0):
     """ [GeoCOM manual **p40**] """
 
-    request = CreateRequest('18005', [on])
+    request, trid = CreateRequest('18005', [on])
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('ATR activated or deactivated')
+        _dbg('ATR activated or deactivated')
 
     return [error, response.RC, []]
 
@@ -1560,15 +1968,14 @@ def AUS_SetUserAtrState(on=0):
 def AUS_GetUserLockState():
     """ [GeoCOM manual **p41**] """
 
-    request = CreateRequest('18008')
+    request, trid = CreateRequest('18008')
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Lock activated or deactivated')
+        _dbg('Lock activated or deactivated')
 
     return [error, response.RC, response.parameters]
 
@@ -1576,15 +1983,14 @@ def AUS_GetUserLockState():
 def AUS_GetUserAtrState():
     """ [GeoCOM manual **p39**] """
 
-    request = CreateRequest('18006')
+    request, trid = CreateRequest('18006')
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('ATR activated or deactivated')
+        _dbg('ATR activated or deactivated')
 
     return [error, response.RC, response.parameters]
 
@@ -1592,41 +1998,70 @@ def AUS_GetUserAtrState():
 ################# BASIC MAN MACHINE INTERFACE – BMM #############################
 ##############################################################################"""
 
-def  BMM_BeepAlarm():
+def _make_simple(name, opcode, msg, doc):
     """
-    This function produces a triple beep with the configured intensity and frequency,
-    which cannot be changed. If there is a continuous signal active, it will be stopped before.
-    :return:
+    Build a zero-argument wrapper for an RC-only GeoCOM command.
+
+    The generated wrapper sends the command and reports [error, RC, []]
+    exactly like the handwritten ones it replaces; keeping them in one
+    table avoids a dozen copies of the same body.
+
+    :param name: public name of the wrapper
+    :type name: str
+    :param opcode: GeoCOM command number
+    :type opcode: str
+    :param msg: debug message reported on success
+    :type msg: str
+    :param doc: docstring attached to the wrapper
+    :type doc: str
+
+    :returns: the wrapper function
+    :rtype: function
     """
-    request = CreateRequest('11004')
 
-    response = SerialRequest(request)
+    def wrapper():
+        request, trid = CreateRequest(opcode)
 
-    error = 1
-    if (response.RC == 0):
-        error = 0
-        if (Debug_Level == 1):
-            print('Beep 3 times \n')
+        response = SerialRequest(request, trid, parse_params=False)
 
-    return [error, response.RC, []]
+        error = 1
+        if (response.RC == 0):
+            error = 0
+            _dbg(msg)
 
-def BMM_BeepNormal():
-    """
+        return [error, response.RC, []]
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = name
+    wrapper.__doc__ = doc
+    return wrapper
+
+
+# (name, opcode, success message, docstring) of the zero-argument RC-only
+# commands; the wrappers are generated from the template above
+_SIMPLE_COMMANDS = (
+    ('BMM_BeepAlarm', '11004', 'Beep 3 times \n',
+     """
+    This function produces a triple beep with the configured intensity and frequency,
+    which cannot be changed. If there is a continuous signal active, it will be stopped before.
+    :return:
+    """),
+    ('BMM_BeepNormal', '11003', 'Beep once \n',
+     """
     This function produces a single beep with the configured intensity and frequency, which cannot be changed.
     If a continuous signal is active, it will be stopped first.
     :return:
-    """
-    request = CreateRequest('11003')
-
-    response = SerialRequest(request)
-
-    error = 1
-    if (response.RC == 0):
-        error = 0
-        if (Debug_Level == 1):
-            print('Beep once \n')
+    """),
+    ('IOS_BeepOff', '20000', 'Beep once \n',
+     """
+    This function switches off the beep-signal.
+    :return:
+    """),
+)
 
-    return [error, response.RC, []]
+for _entry in _SIMPLE_COMMANDS:
+    globals()[_entry[0]] = _make_simple(*_entry)
+del _entry
 
 def BMM_BeepOn(nIntens = 10):
     """
@@ -1634,31 +2069,14 @@ def BMM_BeepOn(nIntens = 10):
     If a continuous signal is active, it will be stopped first. Turn off the beeping device with IOS_BeepOff.
     :return:
     """
-    request = CreateRequest('20001')
+    request, trid = CreateRequest('20001')
 
-    response = SerialRequest(request)
+    response = SerialRequest(request, trid, parse_params=False)
 
     error = 1
     if (response.RC == 0):
         error = 0
-        if (Debug_Level == 1):
-            print('Beep once \n')
+        _dbg('Beep once \n')
 
     return [error, response.RC, []]
 
-def IOS_BeepOff():
-    """
-    This function switches off the beep-signal.
-    :return:
-    """
-    request = CreateRequest('20000')
-
-    response = SerialRequest(request)
-
-    error = 1
-    if (response.RC == 0):
-        error = 0
-        if (Debug_Level == 1):
-            print('Beep once \n')
-
-    return [error, response.RC, []]
@@ -3,26 +3,59 @@
 .. module:: track
 
 """
-import importlib
 import sys
-sys.path.append(r"C:\Python27\Lib")
-# sys.path.append(r"C:\Python27\Lib\site-packages")
-sys.path.append(r"src")
+import queue
+import threading
 import time
 import math
 import GeoCom
 from math import sin,cos,sqrt
+try:
+    import numpy as np
+except ImportError:
+    np = None # batch computation unavailable, single measurements still work
+try:
+    from numba import njit
+except ImportError:
+    njit = None # math core runs interpreted, see _cart
 from optparse import OptionParser
-from operator import neg
+import ctypes
+import logging
 import os
 
-#insted of reload that is obsolite in v3
-importlib.reload(sys)
-#sys.setdefaultencoding('utf8') In python 3 the utf8 is hardocred by default ;)
 OLD_COORD=[0,0,0]
 FAIL_COUNT=0
 DEBUG=False
 
+# one precompiled formatter instead of six string concatenations per sample
+_COORD_FMT = '%.4f;%.4f;%.4f;'.__mod__
+
+# constants for the search retry paths, converted once instead of per attempt
+_DEG_TO_RAD = math.pi / 180.0
+_FINE_ADJUST = (math.radians(20), math.radians(20))
+
+if os.name == 'nt':
+    _kernel32 = ctypes.windll.kernel32
+    _hstdout = _kernel32.GetStdHandle(-11) # STD_OUTPUT_HANDLE
+
+    def _set_color(attr):
+        """
+        Set the console text color through the cached console handle.
+
+        os.system('color XX') spawned a cmd.exe per call - tens of ms on
+        every measurement, dwarfing the serial round trip itself.
+
+        :param attr: console attribute, e.g. 0x2F for white on green
+        :type attr: int
+        """
+        _kernel32.SetConsoleTextAttribute(_hstdout, attr)
+else:
+    def _set_color(attr):
+        """
+        No-op placeholder; console colors are only set on Windows.
+        """
+        pass
+
 def powerSearchPrism(cHz = 0, cV=1.57, aHz = 1.0 , aV = 1.0):
     """
     Performs a PowerSearch, starting from the angular position (cHz, cV) and
@@ -47,9 +80,9 @@ def powerSearchPrism(cHz = 0, cV=1.57, aHz = 1.0 , aV = 1.0):
     b = GeoCom.AUT_PS_SetRange(5,100) # Set range of the PowerSearch in the interval [5,100] meters
     c = GeoCom.AUT_PS_EnableRange(1) # Activate the range restriction
     if GeoCom.AUT_PS_SearchWindow()[1] == 0: # Launch PowerSearch
-        [error, RC, parameters] = GeoCom.AUT_FineAdjust(math.radians(20),math.radians(20))
+        [error, RC, parameters] = GeoCom.AUT_FineAdjust(*_FINE_ADJUST)
         if RC != 0:
-            os.system('color 0F')
+            _set_color(0x0F)
             return False
     else :
         return False
@@ -60,7 +93,7 @@ def powerSearchPrism(cHz = 0, cV=1.57, aHz = 1.0 , aV = 1.0):
         return True
     else :
         print("Locked fail")
-        os.system('color 0F')
+        _set_color(0x0F)
         print(str(RC))
         print(str(error))
         print("Can not lock prism... retry")
@@ -79,10 +112,10 @@ def searchPrism(Hz = 20 , V=20):
 
     """
     print("Searching for the prism ...")
-    if GeoCom.AUT_Search(math.radians(Hz),math.radians(V))[1] == 0:
-        [error, RC, parameters] = GeoCom.AUT_FineAdjust(math.radians(Hz/2),math.radians(V/2))
+    if GeoCom.AUT_Search(Hz * _DEG_TO_RAD, V * _DEG_TO_RAD)[1] == 0:
+        [error, RC, parameters] = GeoCom.AUT_FineAdjust(Hz / 2 * _DEG_TO_RAD, V / 2 * _DEG_TO_RAD)
         if RC != 0:
-            os.system('color 0F')
+            _set_color(0x0F)
             #GeoCom.COM_CloseConnection()
             #sys.exit("Can not found prism... exiting")
             return False
@@ -95,7 +128,7 @@ def searchPrism(Hz = 20 , V=20):
         return True
     else :
         print("Locked fail")
-        os.system('color 0F')
+        _set_color(0x0F)
         print(str(RC))
         print(str(error))
         print("Can not lock prism... retry")
@@ -129,7 +162,10 @@ def usage(COM ="COM3", baud = 57600):
     parser.add_option("-d", "--debug", action="store_true", dest="debug", help="print debug information")
     parser.add_option("-B", "--Big", action="store_true", dest="big_prism", help="set the big prism as prism type [default: mini prism]")
     (options, args) = parser.parse_args()
-    if options.debug : DEBUG = True
+    if options.debug :
+        DEBUG = True
+        logging.basicConfig(level=logging.DEBUG)
+        GeoCom.set_debug(True)
     return options
 
 def connection(options):
@@ -141,7 +177,7 @@ def connection(options):
     :type options: Namespace
     """
     if GeoCom.COM_OpenConnection(options.port, options.baudrate )[0]:
-        os.system('color 0F')
+        _set_color(0x0F)
         sys.exit("Can not open Port... exiting")
 
 def set_x_axis():
@@ -173,6 +209,31 @@ def set_laser(value):
     """
     [error, RC, args] = GeoCom.EDM_Laserpointer(value)
 
+def _search_until_found(phi=0.0, theta=1.57, window=6.28, factor=2):
+    """
+    Retry the power search until the prism is found again.
+
+    The GeoCOM link is strictly request/reply, so there is no readable
+    event to wait on while the station searches; instead of a fixed
+    interval the pause between attempts backs off exponentially, from
+    0.1 s doubling up to 2 s. Retries come quickly right after a loss
+    and stop hammering the station when the prism stays hidden.
+
+    :param phi: horizontal angle of the search center (rad)
+    :type phi: float
+    :param theta: vertical angle of the search center (rad)
+    :type theta: float
+    :param window: width of the search window (rad)
+    :type window: float
+    :param factor: search pattern parameter passed to powerSearchPrism
+    :type factor: int
+    """
+    delay = 0.1
+    while not powerSearchPrism(phi, theta, window, factor):
+        print("search again")
+        time.sleep(delay)
+        delay = min(delay * 2, 2)
+
 def setup_station_manual(options):
     """
     Set up the station for the purpose of tracking a prism and make fast reapeated measurements.
@@ -191,12 +252,12 @@ def setup_station_manual(options):
     input('Direct the station to the prism and press <enter>') #raw input is obsolite in v3
     set_laser(0)
     if not powerSearchPrism():
-        while not powerSearchPrism(0.0, 1.57, 6.28, 2):
-            print("search again")
-            time.sleep(0.1)
+        _search_until_found()
 
-    GeoCom.TMC_SetEdmMode(9) #EDM_CONT_FAST = 9, // Fast repeated measurement (geocom manual p.91)
-    GeoCom.TMC_DoMeasure()
+    # EDM_CONT_FAST = 9, // Fast repeated measurement (geocom manual p.91)
+    # both setup commands go out in one write, saving a serial round trip
+    GeoCom.SerialRequestPipeline([GeoCom.CreateRequest('2020', [9]),
+                                  GeoCom.CreateRequest('2008', [1, 1])])
     time.sleep(1)
     print("Station is set up")
 
@@ -208,15 +269,40 @@ def setup_station(options):
     set_prism_type(options.big_prism)
     set_laser(0)
     if not powerSearchPrism():
-        while not powerSearchPrism(0.0, 1.57, 6.28, 2):
-            print("search again")
-            time.sleep(0.1)
+        _search_until_found()
 
-    GeoCom.TMC_SetEdmMode(9) #EDM_CONT_FAST = 9, // Fast repeated measurement (geocom manual p.91)
-    GeoCom.TMC_DoMeasure()
+    # EDM_CONT_FAST = 9, // Fast repeated measurement (geocom manual p.91)
+    # both setup commands go out in one write, saving a serial round trip
+    GeoCom.SerialRequestPipeline([GeoCom.CreateRequest('2020', [9]),
+                                  GeoCom.CreateRequest('2008', [1, 1])])
     time.sleep(1)
     print("Station is set up")
 
+def _cart(phi, theta, radius):
+    """
+    Pure math core of compute_carthesian, kept free of string handling so
+    Numba can compile it to native code when available.
+
+    :param phi: horizontal angle (rad)
+    :type phi: float
+    :param theta: vertical angle (rad)
+    :type theta: float
+    :param radius: distance from the station to the prism (m)
+    :type radius: float
+
+    :returns: (x, y, z) coordinates
+    :rtype: tuple
+    """
+    sin_t = sin(theta)
+    return (sin_t * cos(phi) * radius,
+            sin_t * sin(phi) * radius,
+            cos(theta) * radius)
+
+if njit is not None:
+    # cache=True keeps the compiled code across sessions; fastmath is fine
+    # since the results are rounded to 4 decimals anyway
+    _cart = njit(cache=True, fastmath=True)(_cart)
+
 def compute_carthesian(phi,theta,radius):
     """
     Compute carthesian coordinates using vertical, horizontal angles and distance measurements.
@@ -231,13 +317,77 @@ def compute_carthesian(phi,theta,radius):
     :returns: a string with the coordinates, formatted as x;y;z
     :rtype: str
     """
-    point_x = round(sin(theta) * cos(phi) * radius,4)
-    point_y = round(sin(theta) * sin(phi) * radius,4)
-    point_z = round(cos(theta) * radius,4)
+    # %.4f rounds while formatting, replacing the old round()+str()+concat
+    # chain and its intermediate string objects
+    return _COORD_FMT(_cart(phi, theta, radius))
+
+def compute_carthesian_batch(phi, theta, radius):
+    """
+    Vectorized variant of compute_carthesian for buffered measurements.
+
+    Converts whole arrays of samples with a few NumPy ufunc calls instead
+    of per-sample Python math, which pays off when EDM_CONT_FAST streams
+    many samples per second. Requires numpy.
 
-    #print the coordinates
-    # print ('x('+str(point_x)+') y('+str(point_y)+') z('+str(point_z)+')')
-    return ''+str(point_x)+';'+str(point_y)+';'+str(point_z)+';'
+    Unlike compute_carthesian this takes the station's horizontal angles
+    as measured: the sign flip from the clockwise Hz convention to the
+    right-handed math convention (the -coord[0] in the single-sample
+    handlers) is done here in one vectorized pass.
+
+    :param phi: horizontal angles as returned by the station (rad)
+    :param theta: vertical angles (rad)
+    :param radius: distances from the station to the prism (m)
+
+    :returns: list of strings, each formatted as x;y;z;
+    :rtype: list
+    """
+    phi = -np.asarray(phi, dtype=float)
+    theta = np.asarray(theta, dtype=float)
+    radius = np.asarray(radius, dtype=float)
+    sin_t = np.sin(theta)
+    point_x = sin_t * np.cos(phi) * radius
+    point_y = sin_t * np.sin(phi) * radius
+    point_z = np.cos(theta) * radius
+    return [_COORD_FMT((x, y, z))
+            for x, y, z in zip(point_x, point_y, point_z)]
+
+def _measure_ok(RC, coord):
+    """Handle a complete measurement (RC=0)."""
+    global OLD_COORD, FAIL_COUNT
+    _set_color(0x2F)
+    OLD_COORD = coord
+    FAIL_COUNT = 0
+    return '0;'+ compute_carthesian(-coord[0], coord[1], coord[2])
+
+def _measure_accuracy_warn(RC, coord):
+    """Handle a complete measurement whose accuracy is not guaranteed (RC=1284)."""
+    global OLD_COORD
+    _set_color(0x06)
+    OLD_COORD = coord
+    print('Accuracy could not be guaranteed \n')
+    return '1;'+compute_carthesian(-coord[0], coord[1], coord[2])
+
+def _measure_angle_only(RC, coord):
+    """Handle an angle-only measurement (RC=1285 or RC=1288)."""
+    global FAIL_COUNT
+    _set_color(0x04)
+    print('Only angle measurement : '+str(RC))
+    FAIL_COUNT+=1
+    return '2'
+
+def _measure_error(RC, coord):
+    """Handle any other return code."""
+    global FAIL_COUNT
+    _set_color(0x4F)
+    print('\n'+'ERROR, Return code: '+str(RC)+'\n')
+    FAIL_COUNT+=1
+    return "3"
+
+# return code -> handler; dict lookup replaces the old if/elif chain
+_RC_HANDLERS = {0: _measure_ok,
+                1284: _measure_accuracy_warn,
+                1285: _measure_angle_only,
+                1288: _measure_angle_only}
 
 def get_measure():
     """
@@ -258,57 +408,64 @@ def get_measure():
     """
     global OLD_COORD, FAIL_COUNT
     if FAIL_COUNT > 100:
-        if not powerSearchPrism(float(OLD_COORD[0]),float(OLD_COORD[1])):
-            while not powerSearchPrism(float(OLD_COORD[0]),float(OLD_COORD[1]), 6.28, 2):
-                print("search again")
-                time.sleep(2)
+        if not powerSearchPrism(OLD_COORD[0], OLD_COORD[1]):
+            _search_until_found(OLD_COORD[0], OLD_COORD[1])
         FAIL_COUNT = 0
     try:
         [error, RC, coord] = GeoCom.TMC_GetSimpleMea(150, 1)
-        if RC==0:
-            os.system('color 2F')
-            OLD_COORD = coord
-            res = '0;'+ compute_carthesian(-float(coord[0]),float(coord[1]),float(coord[2]))
-            FAIL_COUNT = 0
-            # print res
-            return res
-        elif RC==1284:
-            os.system('color 06')
-            OLD_COORD = coord
-            res = '1;'+compute_carthesian(-float(coord[0]),float(coord[1]),float(coord[2]))
-            print('Accuracy could not be guaranteed \n')
-            # FAIL_COUNT+=1
-            powerSearchPrism# print res
-            return res
-        elif RC==1285 or RC==1288:
-            os.system('color 04')
-            print('Only angle measurement : '+str(RC))
-            res = '2'#+compute_carthesian(float(coord[0]),float(coord[1]),float(OLD_COORD[2]))
-            coord = OLD_COORD
-            FAIL_COUNT+=1
-            # print res
-            return res
-        else:
-            os.system('color 4F')
-            print('\n'+'ERROR, Return code: '+str(RC)+'\n')
-            FAIL_COUNT+=1
-            return "3"
+        # O(1) dispatch on the return code, see _RC_HANDLERS
+        return _RC_HANDLERS.get(RC, _measure_error)(RC, coord)
     except ValueError:
-        os.system('color 4F')
+        _set_color(0x4F)
         print( "Non numeric value recieved!" )
         FAIL_COUNT+=1
         return "3"
     except GeoCom.SerialRequestError as e :
         return "4"
 
+def track_loop(output=print):
+    """
+    Run the measurement loop with the serial link and output decoupled.
+
+    A producer thread calls get_measure back to back and pushes each
+    result on a queue; the calling thread pops results and hands them to
+    *output*. A stalled writer (file, UI, network) therefore no longer
+    delays the next GeoCOM request, so the sample rate stays pinned to
+    the serial round trip. Returns on KeyboardInterrupt.
+
+    :param output: callable invoked with each measurement string
+    :type output: callable
+    """
+    results = queue.SimpleQueue()
+    stop = threading.Event()
+
+    def _produce():
+        while not stop.is_set():
+            results.put(get_measure())
+
+    producer = threading.Thread(target=_produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            output(results.get())
+    except KeyboardInterrupt:
+        stop.set()
+        producer.join(timeout=2)
+        _set_color(0x0F)
+        GeoCom.COM_CloseConnection()
+
 def open(port = "COM3", baud = 57600):
+    """
+    Open the connection with *port* and *baud* as defaults; any -p/-b
+    command line options still take precedence via usage().
+    """
     options = usage(port, baud)
     connection(options)
     #setup_station(options)
     return 1
 
 def close():
-    os.system('color 0F')
+    _set_color(0x0F)
     j=GeoCom.COM_CloseConnection()
     return j[0]
 
@@ -319,36 +476,15 @@ def close():
 
 if __name__ == '__main__':
     #TODO Fine tuning
-    com_port = ""
-    baudrate = 0
-    i = 0
-    while(i < len(sys.argv)):
-        if (str(sys.argv[i]) == "-p"):
-            com_port = str(sys.argv[i+1])
-        elif (str(sys.argv[i]) == "-b"):
-            baudrate = str(sys.argv[i+1])
-        i = i + 1
-    if (com_port != "" and baudrate != 0):
-        print ("Oppening port : " + com_port + " , with baudrate - " + str(baudrate) + "\n")
-        open(com_port, baudrate)
-    else:
-       sys.exit("Invalid Arguments... Exiting...")
-    # try :
-    #     while True: #while program not interrupted by the user
-    #         t_start = time.time()
-    #         print get_measure()
-    #         t_end = time.time()
-    #         # print(t_end-t_start)
-    # except KeyboardInterrupt :
-    #     time.sleep(2)
-    #     os.system('color 0F')
-    #     j=GeoCom.COM_CloseConnection()
-    #     sys.exit("Keyboard Interruption by user")
-    # # Closing serial connection, when execution is stopped
-    # os.system('color 0F')
-    # GeoCom.COM_CloseConnection()
+    # usage() is the single place where sys.argv is parsed; the old manual
+    # -p/-b loop duplicated it and the two could disagree
+    options = usage()
+    print ("Oppening port : " + options.port + " , with baudrate - " + str(options.baudrate) + "\n")
+    connection(options)
+    # continuous tracking runs through track_loop(); the default __main__
+    # run only checks that the station answers
     GeoCom.CSV_GetInstrumentNo()
-    os.system('color 0F')
+    _set_color(0x0F)
     GeoCom.COM_CloseConnection()
 
 #TODO Create log insted of print